@@ -5,29 +5,194 @@ Main automation script for GitHub Actions workflow.
 """
 
 import os
-import json
+import asyncio
 import base64
+import hashlib
 import logging
-import requests
+import logging.handlers
+import multiprocessing
+import re
+import httpx
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import PyPDF2
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import aiofiles
+import ahocorasick
+import orjson
+import pypdfium2 as pdfium
 import docx
 from io import BytesIO
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('automation.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Worker processes are spawned, not forked: by the time the pool starts, the parent may
+# have torch/tokenizer threads running. Queues shared with workers must use this context too.
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+# Queue feeding the log listener; a multiprocessing queue so pool workers can log through it too
+log_queue: Optional[multiprocessing.Queue] = None
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """Make logging a non-blocking enqueue; a listener thread writes records to file and console."""
+    global log_queue
+    log_queue = MP_CONTEXT.Queue(-1)
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('automation.log', delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    # File I/O happens on the listener thread, off the hot path; each record is flushed
+    # so nothing is lost if the run is killed
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    init_worker_logging(log_queue)
+    return listener
+
+def init_worker_logging(queue: Optional[multiprocessing.Queue]) -> None:
+    """Attach only a QueueHandler to the root logger of this process."""
+    if queue is None:
+        return
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(queue)]
+    root.setLevel(logging.INFO)
+
+def shutdown_logging(listener: logging.handlers.QueueListener) -> None:
+    """Drain queued records and close the listener's handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+# Output and cache directories, created once per process by ensure_directories
+OUTPUT_DIRECTORIES = ('resumes', 'jobs', 'generated_resumes', 'reports', '.cache')
+directories_ready = False
+
+HF_INFERENCE_URL = "https://api-inference.huggingface.co/models"
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+# Common tech skills looked for in the raw resume
+TECH_SKILLS = [
+    'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 
+    'Kubernetes', 'SQL', 'PostgreSQL', 'MongoDB', 'Git', 'TypeScript',
+    'Java', 'C++', 'HTML', 'CSS', 'Vue.js', 'Angular', 'Django', 'Flask'
+]
+
+# Skills extracted from LLM analysis output
+COMMON_SKILLS = [
+    'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker',
+    'Kubernetes', 'SQL', 'TypeScript', 'Git', 'PostgreSQL', 'MongoDB'
+]
+
+def build_skill_automaton(skills: List[str]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton mapping lowercased skills to their display names."""
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill.lower(), skill)
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import; a single pass over the text finds every skill
+SKILL_AUTOMATON = build_skill_automaton(list(dict.fromkeys(TECH_SKILLS + COMMON_SKILLS)))
+
+# Words ignored when scoring keyword overlap
+STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Keeps tech tokens such as "node.js", "c++" and "c#" intact, without trailing punctuation
+TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+
+def tokenize(text: str) -> frozenset:
+    """Return the set of lowercased keyword tokens in text, minus stop words."""
+    return frozenset(TOKEN_RE.findall(text.lower())) - STOP_WORDS
+
+def job_text(job: Dict) -> str:
+    """Return the text a resume is matched against for a job."""
+    return f"{job['title']} {job['description']} {' '.join(job.get('requirements', []))}"
+
+def job_fingerprints(jobs: List[Dict]) -> set:
+    """Return (id, sha256(description)) per job; volatile fields such as posted_date are ignored."""
+    return {
+        (job['id'], hashlib.sha256(job['description'].encode('utf-8')).hexdigest())
+        for job in jobs
+    }
+
+def job_keywords(job: Dict) -> frozenset:
+    """Return the keyword tokens for a job, using the set precomputed by search_jobs if present."""
+    words = job.get('_words')
+    if words is None:
+        words = tokenize(job_text(job))
+    return words
+
+# "5 years", "1 year" etc. in analysis text
+YEARS_RE = re.compile(r"(\d+)\s*years?", re.IGNORECASE)
+
+# Specific claims that could be fabricated, matched in a single pass per line
+CLAIM_RE = re.compile(r"worked at|employed by|certified in|degree from", re.IGNORECASE)
+
+# Word n-gram length used to decide whether generated content came from the master resume
+SHINGLE_SIZE = 5
+
+def shingles(tokens: List[str], size: int = SHINGLE_SIZE) -> set:
+    """Return hashes of every run of size consecutive tokens."""
+    return {hash(tuple(tokens[i:i + size])) for i in range(len(tokens) - size + 1)}
+
+class TextProfile(NamedTuple):
+    """Lowercased unique lines of a text with their tokens, plus its keyword set."""
+    lines: Dict[str, List[str]]
+    words: frozenset
+
+def analyze_text(text: str) -> TextProfile:
+    """Lowercase and tokenize text in one pass, for both auditing and match scoring."""
+    lines = {}
+    for line in text.lower().splitlines():
+        line = line.strip()
+        if line and line not in lines:
+            lines[line] = TOKEN_RE.findall(line)
+    # Tokens never span a newline, so the per-line tokens cover the whole text
+    words = frozenset(token for tokens in lines.values() for token in tokens) - STOP_WORDS
+    return TextProfile(lines, words)
+
+def find_skills(text: str) -> set:
+    """Return the set of known skills mentioned anywhere in text."""
+    return {skill for _, skill in SKILL_AUTOMATON.iter(text.lower())}
+
 class SkillSyncAutomator:
+    # Prompt templates, filled with str.format on each call
+    ANALYZE_PROMPT = """
+Analyze this resume and extract:
+1. Key technical skills and technologies
+2. Years of experience
+3. Suitable job titles/roles
+4. Industry/domain expertise
+
+Resume:
+{resume}
+
+Return response as structured data focusing on job search keywords.
+"""
+    
+    TAILOR_PROMPT = """
+Create an ATS-optimized resume tailored for this job position.
+
+Job Title: {title}
+Company: {company}
+Requirements: {requirements}
+Job Description: {description}
+
+Original Resume: {resume}
+
+Instructions:
+1. Optimize for ATS by including relevant keywords from job description
+2. Highlight matching skills and experiences
+3. Maintain accuracy - do NOT fabricate information
+4. Adjust emphasis to match job requirements
+5. Keep the same factual content but optimize presentation
+
+Generate the tailored resume:
+"""
+    
     def __init__(self):
         """Initialize the SkillSync automation system."""
         self.github_token = os.getenv('GITHUB_TOKEN')
@@ -37,33 +202,137 @@ class SkillSyncAutomator:
         self.github_repo = os.getenv('GITHUB_REPOSITORY')
         self.webhook_url = os.getenv('WEBHOOK_URL')
         
+        # Shared HTTP client, opened for the duration of each automation run
+        self.http: Optional[httpx.AsyncClient] = None
+        
         # Create necessary directories
         self.ensure_directories()
         
+        # On-disk cache of LLM results, keyed by content hash
+        self.cache_dir = Path('.cache')
+        
         # Hugging Face models
         self.resume_analyzer_model = "microsoft/DialoGPT-medium"
         self.resume_generator_model = "microsoft/DialoGPT-medium" 
         self.audit_model = "sentence-transformers/all-MiniLM-L6-v2"
         
+        # Jobs whose master resume match score is below this are skipped before LLM generation
+        self.min_match_score = 35
+        
+        # Tokenizers used to truncate prompt inputs, loaded on first use per model
+        self._tokenizers: Dict[str, object] = {}
+        
+        # Embedding model for match scores, loaded on first use
+        self._embedder = None
+        self._embedder_loaded = False
+        
         logger.info("SkillSync Automator initialized")
     
     def ensure_directories(self):
-        """Create necessary directories if they don't exist."""
-        directories = ['resumes', 'jobs', 'generated_resumes', 'reports']
-        for directory in directories:
-            Path(directory).mkdir(exist_ok=True)
+        """Create necessary directories if they don't exist; a no-op after the first call."""
+        global directories_ready
+        if directories_ready:
+            return
+        for directory in OUTPUT_DIRECTORIES:
+            os.makedirs(directory, exist_ok=True)
+        directories_ready = True
+    
+    def create_http_client(self) -> httpx.AsyncClient:
+        """Create a pooled keep-alive client for the Hugging Face Inference API."""
+        return httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {self.hf_api_key}"},
+            # Limits go on the transport: AsyncClient ignores limits= when transport= is given
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            ),
+            timeout=45,
+        )
+    
+    async def query_model(self, model: str, payload: Dict, timeout: float, max_retries: int = 3) -> httpx.Response:
+        """POST to the Hugging Face Inference API, backing off on rate limits and gateway errors."""
+        for attempt in range(max_retries + 1):
+            response = await self.http.post(
+                f"{HF_INFERENCE_URL}/{model}",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+            if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                return response
+            delay = 0.3 * (2 ** attempt)
+            logger.warning(f"Hugging Face API returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return response
+    
+    @staticmethod
+    def cache_key(*parts: str) -> str:
+        """Build a cache key from the content the cached result depends on."""
+        # NUL-separated so adjacent parts cannot run together into the same key
+        return hashlib.sha256("\0".join(parts).encode('utf-8')).hexdigest()
+    
+    def read_cache(self, key: str):
+        """Return the cached value for key, or None on a miss."""
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            return orjson.loads(cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_file.name}: {str(e)}")
+            return None
+    
+    def write_cache(self, key: str, value) -> None:
+        """Store a JSON-serializable value under key; a failed write only costs the cache entry."""
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(value))
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {cache_file.name}: {str(e)}")
+    
+    def get_tokenizer(self, model: str):
+        """Load the tokenizer for model on first use; None if it is unavailable."""
+        if model not in self._tokenizers:
+            try:
+                from transformers import AutoTokenizer
+                self._tokenizers[model] = AutoTokenizer.from_pretrained(model)
+            except Exception as e:
+                logger.warning(f"Tokenizer for {model} unavailable, truncating by words: {str(e)}")
+                self._tokenizers[model] = None
+        return self._tokenizers[model]
+    
+    def truncate_tokens(self, text: str, max_tokens: int, model: str) -> str:
+        """Truncate text to at most max_tokens tokens of model."""
+        tokenizer = self.get_tokenizer(model)
+        if tokenizer is None:
+            # Roughly four characters per token; cut back to the last whole word
+            max_chars = max_tokens * 4
+            if len(text) <= max_chars:
+                return text
+            return text[:max_chars].rsplit(None, 1)[0]
+        
+        token_ids = tokenizer.encode(text, add_special_tokens=False)
+        if len(token_ids) <= max_tokens:
+            return text
+        return tokenizer.decode(token_ids[:max_tokens]).strip()
     
     def get_master_resume(self) -> Optional[str]:
         """Extract text from the master resume file."""
-        resume_dir = Path('resumes')
+        # Single directory pass; DirEntry caches the stat result used for ctime.
+        # Dotfiles such as .gitkeep are not resumes.
+        try:
+            with os.scandir('resumes') as it:
+                entries = [entry for entry in it if entry.is_file() and not entry.name.startswith('.')]
+        except FileNotFoundError:
+            entries = []
         
-        if not resume_dir.exists() or not list(resume_dir.glob('*')):
+        if not entries:
             logger.warning("No master resume found in resumes/ directory")
             return None
             
         # Get the most recent resume file
-        resume_files = list(resume_dir.glob('*'))
-        latest_resume = max(resume_files, key=os.path.getctime)
+        latest_resume = Path(max(entries, key=lambda entry: entry.stat().st_ctime).path)
         
         logger.info(f"Processing master resume: {latest_resume.name}")
         
@@ -81,51 +350,56 @@ class SkillSyncAutomator:
     
     def extract_pdf_text(self, file_path: Path) -> str:
         """Extract text from PDF file."""
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\\n"
-        return text.strip()
+        # Pass the path, not file bytes: PDFium reads pages from disk on demand
+        # in native code, so the file is never copied into a Python buffer
+        pdf = pdfium.PdfDocument(str(file_path))
+        parts = []
+        try:
+            for i in range(len(pdf)):
+                page = pdf.get_page(i)
+                textpage = page.get_textpage()
+                try:
+                    parts.append(textpage.get_text_range())
+                finally:
+                    # Release PDFium handles as we go instead of at GC time
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+        return "\n".join(parts).strip()
     
     def extract_docx_text(self, file_path: Path) -> str:
         """Extract text from DOCX file."""
         doc = docx.Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\\n"
-        return text.strip()
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
     
-    def analyze_resume_with_llm(self, resume_text: str) -> Dict:
+    async def analyze_resume_with_llm(self, resume_text: str) -> Dict:
         """Analyze resume using Hugging Face LLM to extract skills and suitable job titles."""
-        logger.info("Analyzing resume with AI...")
-        
-        prompt = f"""
-        Analyze this resume and extract:
-        1. Key technical skills and technologies
-        2. Years of experience
-        3. Suitable job titles/roles
-        4. Industry/domain expertise
+        cache_key = self.cache_key('analysis', self.resume_analyzer_model, self.ANALYZE_PROMPT, resume_text)
+        cached = self.read_cache(cache_key)
+        if cached is not None:
+            logger.info("Using cached resume analysis")
+            return cached
         
-        Resume:
-        {resume_text[:2000]}  # Limit input length
+        logger.info("Analyzing resume with AI...")
         
-        Return response as structured data focusing on job search keywords.
-        """
+        prompt = self.ANALYZE_PROMPT.format(
+            resume=self.truncate_tokens(resume_text, 512, self.resume_analyzer_model)
+        )
         
         try:
-            response = requests.post(
-                f"https://api-inference.huggingface.co/models/{self.resume_analyzer_model}",
-                headers={"Authorization": f"Bearer {self.hf_api_key}"},
-                json={"inputs": prompt, "parameters": {"max_new_tokens": 500}},
+            response = await self.query_model(
+                self.resume_analyzer_model,
+                {"inputs": prompt, "parameters": {"max_new_tokens": 500}},
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 # Parse the LLM response to extract structured data
                 analysis = self.parse_llm_analysis(result)
                 logger.info(f"Resume analysis completed: {len(analysis.get('skills', []))} skills found")
+                self.write_cache(cache_key, analysis)
                 return analysis
             else:
                 logger.error(f"LLM API error: {response.status_code} - {response.text}")
@@ -159,15 +433,9 @@ class SkillSyncAutomator:
         """Fallback analysis using keyword matching when LLM fails."""
         logger.info("Using fallback resume analysis...")
         
-        # Common tech skills
-        tech_skills = [
-            'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 
-            'Kubernetes', 'SQL', 'PostgreSQL', 'MongoDB', 'Git', 'TypeScript',
-            'Java', 'C++', 'HTML', 'CSS', 'Vue.js', 'Angular', 'Django', 'Flask'
-        ]
-        
         # Find skills mentioned in resume
-        found_skills = [skill for skill in tech_skills if skill.lower() in resume_text.lower()]
+        mentioned = find_skills(resume_text)
+        found_skills = [skill for skill in TECH_SKILLS if skill in mentioned]
         
         # Common job titles
         job_titles = [
@@ -186,11 +454,8 @@ class SkillSyncAutomator:
     def extract_skills_from_text(self, text: str) -> List[str]:
         """Extract technical skills from text."""
         # Simplified skill extraction - in production, use NER models
-        common_skills = [
-            'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker',
-            'Kubernetes', 'SQL', 'TypeScript', 'Git', 'PostgreSQL', 'MongoDB'
-        ]
-        return [skill for skill in common_skills if skill.lower() in text.lower()]
+        mentioned = find_skills(text)
+        return [skill for skill in COMMON_SKILLS if skill in mentioned]
     
     def extract_job_titles_from_text(self, text: str) -> List[str]:
         """Extract suitable job titles from text."""
@@ -202,12 +467,10 @@ class SkillSyncAutomator:
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience from text."""
-        # Simplified extraction - look for number patterns
-        import re
-        years_pattern = r'(\\d+)\\s*year[s]?'
-        matches = re.findall(years_pattern, text.lower())
-        if matches:
-            return int(matches[0])
+        # Simplified extraction - first number followed by "year(s)"
+        match = YEARS_RE.search(text)
+        if match:
+            return int(match.group(1))
         return 3  # Default
     
     def search_jobs(self, job_titles: List[str], skills: List[str]) -> List[Dict]:
@@ -251,49 +514,61 @@ class SkillSyncAutomator:
             }
         ]
         
-        # Save job listings
+        # Save job listings as one JSON Lines file per day, skipping the write if nothing changed
+        jobs_file = Path(f"jobs/jobs_{datetime.now().strftime('%Y%m%d')}.jsonl")
+        if self.saved_jobs_unchanged(jobs_file, mock_jobs):
+            logger.info(f"Job listings unchanged, keeping {jobs_file.name}")
+        else:
+            with open(jobs_file, 'wb') as f:
+                f.write(b"".join(orjson.dumps(job, option=orjson.OPT_APPEND_NEWLINE) for job in mock_jobs))
+        
+        # Tokenize each job once; every match score against it reuses the set
         for job in mock_jobs:
-            job_file = Path(f"jobs/job_{job['id']}.json")
-            with open(job_file, 'w') as f:
-                json.dump(job, f, indent=2)
+            job['_words'] = job_keywords(job)
         
         logger.info(f"Found and saved {len(mock_jobs)} job listings")
         return mock_jobs
     
-    def generate_tailored_resume(self, job: Dict, master_resume: str, analysis: Dict) -> Tuple[str, float]:
+    def saved_jobs_unchanged(self, jobs_file: Path, jobs: List[Dict]) -> bool:
+        """Check whether jobs_file already holds the same listings (by id and description)."""
+        if not jobs_file.exists():
+            return False
+        try:
+            saved_jobs = [orjson.loads(line) for line in jobs_file.read_bytes().splitlines() if line]
+            return job_fingerprints(saved_jobs) == job_fingerprints(jobs)
+        except (OSError, KeyError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Could not read {jobs_file.name}, rewriting it: {str(e)}")
+            return False
+    
+    async def generate_tailored_resume(self, job: Dict, master_resume: str, analysis: Dict) -> str:
         """Generate ATS-optimized resume tailored for specific job."""
-        logger.info(f"Generating tailored resume for: {job['title']} at {job['company']}")
-        
-        prompt = f"""
-        Create an ATS-optimized resume tailored for this job position.
+        cache_key = self.cache_key(
+            'tailored', self.resume_generator_model, self.TAILOR_PROMPT, master_resume, job['id'], job['description']
+        )
+        cached = self.read_cache(cache_key)
+        if cached:
+            logger.info(f"Using cached tailored resume for: {job['title']} at {job['company']}")
+            return cached
         
-        Job Title: {job['title']}
-        Company: {job['company']}
-        Requirements: {', '.join(job.get('requirements', []))}
-        Job Description: {job['description'][:500]}
-        
-        Original Resume: {master_resume[:1500]}
-        
-        Instructions:
-        1. Optimize for ATS by including relevant keywords from job description
-        2. Highlight matching skills and experiences
-        3. Maintain accuracy - do NOT fabricate information
-        4. Adjust emphasis to match job requirements
-        5. Keep the same factual content but optimize presentation
+        logger.info(f"Generating tailored resume for: {job['title']} at {job['company']}")
         
-        Generate the tailored resume:
-        """
+        prompt = self.TAILOR_PROMPT.format(
+            title=job['title'],
+            company=job['company'],
+            requirements=', '.join(job.get('requirements', [])),
+            description=self.truncate_tokens(job['description'], 128, self.resume_generator_model),
+            resume=self.truncate_tokens(master_resume, 384, self.resume_generator_model),
+        )
         
         try:
-            response = requests.post(
-                f"https://api-inference.huggingface.co/models/{self.resume_generator_model}",
-                headers={"Authorization": f"Bearer {self.hf_api_key}"},
-                json={"inputs": prompt, "parameters": {"max_new_tokens": 1000}},
+            response = await self.query_model(
+                self.resume_generator_model,
+                {"inputs": prompt, "parameters": {"max_new_tokens": 1000}},
                 timeout=45
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 generated_text = ""
                 if isinstance(result, list) and result:
                     generated_text = result[0].get('generated_text', '')
@@ -302,11 +577,13 @@ class SkillSyncAutomator:
                 
                 # Extract the generated resume portion
                 resume_content = self.extract_resume_from_response(generated_text, prompt)
+                if not resume_content:
+                    # Model only echoed the prompt or returned nothing
+                    logger.error(f"Resume generation returned no content for: {job['title']} at {job['company']}")
+                    return self.create_fallback_resume(job, master_resume, analysis)
                 
-                # Calculate match score based on keyword overlap
-                match_score = self.calculate_match_score(resume_content, job)
-                
-                return resume_content, match_score
+                self.write_cache(cache_key, resume_content)
+                return resume_content
             else:
                 logger.error(f"Resume generation failed: {response.status_code}")
                 return self.create_fallback_resume(job, master_resume, analysis)
@@ -324,12 +601,13 @@ class SkillSyncAutomator:
             resume_part = response
             
         # Clean up the response
-        lines = resume_part.split('\\n')
+        lines = resume_part.splitlines()
         cleaned_lines = [line.strip() for line in lines if line.strip()]
         
-        return '\\n'.join(cleaned_lines)
+        return '\n'.join(cleaned_lines)
     
-    def create_fallback_resume(self, job: Dict, master_resume: str, analysis: Dict) -> Tuple[str, float]:
+    @staticmethod
+    def create_fallback_resume(job: Dict, master_resume: str, analysis: Dict) -> str:
         """Create a simple tailored resume when LLM fails."""
         logger.info("Creating fallback tailored resume...")
         
@@ -351,60 +629,118 @@ class SkillSyncAutomator:
         - Relevant experience in required technologies
         """
         
-        match_score = self.calculate_match_score(tailored_resume, job)
-        return tailored_resume, match_score
+        return tailored_resume
     
-    def calculate_match_score(self, resume: str, job: Dict) -> float:
-        """Calculate how well the resume matches the job requirements."""
-        job_requirements = job.get('requirements', [])
-        job_text = f"{job['title']} {job['description']} {' '.join(job_requirements)}"
-        
-        # Count matching keywords (simplified approach)
-        resume_lower = resume.lower()
-        job_lower = job_text.lower()
-        
-        # Extract important keywords
-        job_words = set(job_lower.split())
-        resume_words = set(resume_lower.split())
-        
-        # Remove common words
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        job_words = job_words - common_words
-        resume_words = resume_words - common_words
+    @staticmethod
+    def calculate_match_score(resume_words: frozenset, job: Dict) -> float:
+        """Calculate how well the resume's keywords (see tokenize/analyze_text) match the job requirements."""
+        job_words = job_keywords(job)
         
         if not job_words:
             return 50.0  # Default score
             
         # Calculate overlap
-        overlap = len(job_words.intersection(resume_words))
+        overlap = len(job_words & resume_words)
         total_job_words = len(job_words)
         
         match_percentage = (overlap / total_job_words) * 100
         return min(max(match_percentage, 30), 95)  # Keep between 30-95%
     
-    def audit_resume(self, generated_resume: str, master_resume: str, job: Dict) -> Dict:
-        """Audit generated resume for hallucinations and accuracy."""
+    def get_embedder(self):
+        """Load the sentence embedding model on first use; None if it is unavailable."""
+        if not self._embedder_loaded:
+            self._embedder_loaded = True
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedder = SentenceTransformer(self.audit_model)
+            except Exception as e:
+                logger.warning(f"Embedding model unavailable, using keyword match scores: {str(e)}")
+        return self._embedder
+    
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Return normalized embeddings for texts, encoding cache misses in one batch."""
+        embeddings = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cache_file = self.cache_dir / f"emb_{self.cache_key(self.audit_model, text)}.npy"
+            if cache_file.exists():
+                try:
+                    embeddings[text] = np.load(cache_file)
+                    continue
+                except (OSError, ValueError, EOFError) as e:
+                    logger.warning(f"Ignoring unreadable cache entry {cache_file.name}: {str(e)}")
+            missing.append(text)
+        
+        if missing:
+            encoded = self.get_embedder().encode(
+                missing, batch_size=32, convert_to_numpy=True, normalize_embeddings=True
+            )
+            for text, embedding in zip(missing, encoded):
+                embeddings[text] = embedding
+                np.save(self.cache_dir / f"emb_{self.cache_key(self.audit_model, text)}.npy", embedding)
+        
+        return np.stack([embeddings[text] for text in texts])
+    
+    def semantic_match_scores(self, resumes: List[str], jobs: List[Dict]) -> Optional[List[float]]:
+        """Score each resume against its job by embedding cosine similarity; None if embedding is unavailable or fails."""
+        if not resumes or self.get_embedder() is None:
+            return None
+        try:
+            resume_embeddings = self.embed_texts(resumes)
+            job_embeddings = self.embed_texts([job_text(job) for job in jobs])
+        except Exception as e:
+            logger.warning(f"Embedding failed, using keyword match scores: {str(e)}")
+            return None
+        similarities = np.einsum('ij,ij->i', resume_embeddings, job_embeddings) * 100
+        return [min(max(float(similarity), 30), 95) for similarity in similarities]  # Keep between 30-95%
+    
+    def filter_matching_jobs(self, jobs: List[Dict], master_resume: str) -> List[Dict]:
+        """Drop jobs whose match score against the master resume is below min_match_score."""
+        pre_scores = self.semantic_match_scores([master_resume] * len(jobs), jobs)
+        if pre_scores is None:
+            master_words = tokenize(master_resume)
+            pre_scores = [self.calculate_match_score(master_words, job) for job in jobs]
+        
+        matching_jobs = []
+        for job, pre_score in zip(jobs, pre_scores):
+            if pre_score < self.min_match_score:
+                logger.info(f"Skipping {job['title']} at {job['company']}: match score {pre_score:.1f}%")
+            else:
+                matching_jobs.append(job)
+        return matching_jobs
+    
+    @staticmethod
+    def audit_resume(generated: TextProfile, master_resume: str, job: Dict) -> Dict:
+        """Audit a generated resume, profiled with analyze_text, for hallucinations and accuracy."""
         logger.info("Auditing generated resume for accuracy...")
         
         # Simple audit checks
         issues = []
         hallucination_score = 0.0
         
-        # Check for basic consistency
-        master_lines = set(master_resume.lower().split('\\n'))
-        generated_lines = set(generated_resume.lower().split('\\n'))
+        # Shingle the master resume once; lines whose word 5-grams are mostly
+        # absent from it are new content, regardless of whitespace or layout
+        master_tokens = TOKEN_RE.findall(master_resume.lower())
+        master_shingles = shingles(master_tokens)
+        master_joined = f" {' '.join(master_tokens)} "
         
-        # Look for completely new lines that might be hallucinations
-        new_lines = generated_lines - master_lines
         concerning_additions = []
-        
-        for line in new_lines:
-            line = line.strip()
-            if len(line) > 20:  # Only check substantial additions
-                # Check if it contains specific claims that could be fabricated
-                if any(keyword in line for keyword in ['worked at', 'employed by', 'certified in', 'degree from']):
-                    concerning_additions.append(line)
-                    hallucination_score += 0.5
+        for line, line_tokens in generated.lines.items():
+            if len(line) <= 20:  # Only check substantial additions
+                continue
+            # Check if it contains specific claims that could be fabricated
+            if not CLAIM_RE.search(line):
+                continue
+            
+            if len(line_tokens) < SHINGLE_SIZE:
+                is_new = f" {' '.join(line_tokens)} " not in master_joined
+            else:
+                line_shingles = shingles(line_tokens)
+                is_new = len(line_shingles - master_shingles) / len(line_shingles) > 0.5
+            
+            if is_new:
+                concerning_additions.append(line)
+                hallucination_score += 0.5
         
         # Create issues for concerning additions
         for addition in concerning_additions:
@@ -434,42 +770,51 @@ class SkillSyncAutomator:
         
         return audit_result
     
-    def save_resume_and_report(self, job: Dict, resume_content: str, audit_result: Dict, match_score: float):
+    @staticmethod
+    async def save_resume_and_report(job: Dict, resume_content: str, audit_result: Dict, match_score: float):
         """Save generated resume and audit report."""
         job_id = job['id']
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         
         # Save resume (as text for now - in production, convert to PDF)
         resume_filename = f"resume_{job['company'].replace(' ', '').lower()}_{job_id}.txt"
         resume_path = Path(f"generated_resumes/{resume_filename}")
         
-        with open(resume_path, 'w', encoding='utf-8') as f:
-            f.write(f"RESUME FOR: {job['title']} at {job['company']}\\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\\n")
-            f.write(f"Match Score: {match_score:.1f}%\\n")
-            f.write("=" * 50 + "\\n\\n")
-            f.write(resume_content)
+        resume_text = "".join([
+            f"RESUME FOR: {job['title']} at {job['company']}\n",
+            f"Generated: {now.isoformat()}\n",
+            f"Match Score: {match_score:.1f}%\n",
+            "=" * 50 + "\n\n",
+            resume_content,
+        ])
         
         # Save audit report
         report_filename = f"audit_report_{job_id}_{timestamp}.txt"
         report_path = Path(f"reports/{report_filename}")
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(f"AUDIT REPORT\\n")
-            f.write(f"Job: {job['title']} at {job['company']}\\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\\n")
-            f.write("=" * 50 + "\\n\\n")
-            f.write(f"Overall Score: {audit_result['overall_score']:.1f}%\\n")
-            f.write(f"Hallucination Score: {audit_result['hallucination_score']:.1f}%\\n")
-            f.write(f"Status: {audit_result['status'].upper()}\\n\\n")
-            
-            if audit_result['issues']:
-                f.write("ISSUES FOUND:\\n")
-                for i, issue in enumerate(audit_result['issues'], 1):
-                    f.write(f"{i}. {issue['description']}\\n")
-                    f.write(f"   Suggestion: {issue['suggestion']}\\n\\n")
-            else:
-                f.write("No issues found.\\n")
+        report_parts = [
+            "AUDIT REPORT\n",
+            f"Job: {job['title']} at {job['company']}\n",
+            f"Generated: {now.isoformat()}\n",
+            "=" * 50 + "\n\n",
+            f"Overall Score: {audit_result['overall_score']:.1f}%\n",
+            f"Hallucination Score: {audit_result['hallucination_score']:.1f}%\n",
+            f"Status: {audit_result['status'].upper()}\n\n",
+        ]
+        if audit_result['issues']:
+            report_parts.append("ISSUES FOUND:\n")
+            for i, issue in enumerate(audit_result['issues'], 1):
+                report_parts.append(f"{i}. {issue['description']}\n")
+                report_parts.append(f"   Suggestion: {issue['suggestion']}\n\n")
+        else:
+            report_parts.append("No issues found.\n")
+        
+        # One write per file, off the event loop
+        async with aiofiles.open(resume_path, 'w', encoding='utf-8') as f:
+            await f.write(resume_text)
+        async with aiofiles.open(report_path, 'w', encoding='utf-8') as f:
+            await f.write("".join(report_parts))
         
         logger.info(f"Saved resume: {resume_filename}")
         logger.info(f"Saved audit report: {report_filename}")
@@ -524,7 +869,10 @@ class SkillSyncAutomator:
     def run_automation(self):
         """Main automation workflow."""
         logger.info("Starting SkillSync job search automation...")
-        
+        asyncio.run(self.run_automation_async())
+    
+    async def run_automation_async(self):
+        """Async automation workflow; Hugging Face calls for all jobs run concurrently."""
         try:
             # Step 1: Get master resume
             master_resume = self.get_master_resume()
@@ -532,52 +880,91 @@ class SkillSyncAutomator:
                 logger.error("No master resume found. Please upload a resume first.")
                 return
             
-            # Step 2: Analyze resume with AI
-            analysis = self.analyze_resume_with_llm(master_resume)
+            # The async client is bound to this run's event loop, so it lives per run
+            async with self.create_http_client() as self.http:
+                # Step 2: Analyze resume with AI
+                analysis = await self.analyze_resume_with_llm(master_resume)
+                
+                # Step 3: Search for jobs
+                jobs = self.search_jobs(analysis['job_titles'], analysis['skills'])
+                
+                if not jobs:
+                    logger.info("No new jobs found.")
+                    return
+                
+                # Skip jobs the master resume barely matches before paying for generation
+                jobs = self.filter_matching_jobs(jobs, master_resume)
+                if not jobs:
+                    logger.info(f"No jobs reached the {self.min_match_score}% match threshold.")
+                    return
+                
+                # Step 4: Generate tailored resumes for all jobs concurrently
+                tasks = [self.generate_tailored_resume(job, master_resume, analysis) for job in jobs]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Step 3: Search for jobs
-            jobs = self.search_jobs(analysis['job_titles'], analysis['skills'])
+            # Step 5: Audit (and correct if needed) each job's resume across CPU cores
+            generated = []
+            for job, result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error processing job {job['id']}: {str(result)}")
+                else:
+                    generated.append((job, result))
             
-            if not jobs:
-                logger.info("No new jobs found.")
-                return
+            postprocessed = []
+            if generated:
+                loop = asyncio.get_running_loop()
+                with ProcessPoolExecutor(
+                    max_workers=min(len(generated), os.cpu_count() or 1),
+                    mp_context=MP_CONTEXT,
+                    initializer=init_worker_logging,
+                    initargs=(log_queue,),
+                ) as pool:
+                    postprocessed = await asyncio.gather(*[
+                        loop.run_in_executor(pool, postprocess_job, job, resume_content, master_resume, analysis)
+                        for job, resume_content in generated
+                    ], return_exceptions=True)
+            
+            finished = []
+            for (job, _), outcome in zip(generated, postprocessed):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Error processing job {job['id']}: {str(outcome)}")
+                else:
+                    finished.append((job, *outcome))
+            
+            # Step 6: Score final resumes semantically in one batch; keyword overlap is the fallback
+            match_scores = self.semantic_match_scores(
+                [resume_content for _, resume_content, _, _ in finished],
+                [job for job, _, _, _ in finished],
+            )
+            if match_scores is None:
+                match_scores = [
+                    self.calculate_match_score(resume_words, job)
+                    for job, _, resume_words, _ in finished
+                ]
+            finished = [
+                (job, resume_content, score, audit_result)
+                for (job, resume_content, _, audit_result), score in zip(finished, match_scores)
+            ]
+            
+            # Step 7: Save all resumes and reports concurrently, then notify
+            saved = await asyncio.gather(*[
+                self.save_resume_and_report(job, resume_content, audit_result, match_score)
+                for job, resume_content, match_score, audit_result in finished
+            ], return_exceptions=True)
             
-            # Step 4: Process each job
             processed_count = 0
-            for job in jobs:
-                try:
-                    # Generate tailored resume
-                    resume_content, match_score = self.generate_tailored_resume(
-                        job, master_resume, analysis
-                    )
-                    
-                    # Audit the generated resume
-                    audit_result = self.audit_resume(resume_content, master_resume, job)
-                    
-                    # Check if hallucination score is acceptable
-                    if audit_result['hallucination_score'] > 1.0:
-                        logger.warning(f"High hallucination score for {job['title']}: {audit_result['hallucination_score']:.1f}%")
-                        
-                        # Attempt correction (simplified - just regenerate once)
-                        if audit_result['hallucination_score'] > 3.0:
-                            logger.info("Attempting to regenerate resume with stricter guidelines...")
-                            resume_content, match_score = self.create_fallback_resume(job, master_resume, analysis)
-                            audit_result = self.audit_resume(resume_content, master_resume, job)
-                    
-                    # Save resume and audit report
-                    resume_path, report_path = self.save_resume_and_report(
-                        job, resume_content, audit_result, match_score
-                    )
-                    
-                    # Send notification if audit passed
-                    if audit_result['status'] in ['passed', 'warning']:
-                        self.send_notification_email(job, audit_result, resume_path)
-                    
-                    processed_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing job {job['id']}: {str(e)}")
+            for (job, _, _, audit_result), outcome in zip(finished, saved):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Error processing job {job['id']}: {str(outcome)}")
                     continue
+                
+                resume_path, report_path = outcome
+                
+                # Send notification if audit passed
+                if audit_result['status'] in ['passed', 'warning']:
+                    self.send_notification_email(job, audit_result, resume_path)
+                
+                processed_count += 1
             
             logger.info(f"Automation completed. Processed {processed_count} jobs.")
             
@@ -585,18 +972,44 @@ class SkillSyncAutomator:
             logger.error(f"Automation failed: {str(e)}")
             raise
 
-def main():
-    """Main entry point."""
-    logger.info("=" * 60)
-    logger.info("SkillSync Automator Starting")
-    logger.info("=" * 60)
+def postprocess_job(job: Dict, resume_content: str, master_resume: str, analysis: Dict) -> Tuple[str, frozenset, Dict]:
+    """Audit and, if needed, correct one generated resume; runs in a worker process.
+    
+    Returns the final content, its keyword set (for keyword match scoring) and the audit result.
+    """
+    # One pass over the generated text feeds both the audit and any keyword match score
+    profile = analyze_text(resume_content)
+    audit_result = SkillSyncAutomator.audit_resume(profile, master_resume, job)
     
-    automator = SkillSyncAutomator()
-    automator.run_automation()
+    # Check if hallucination score is acceptable
+    if audit_result['hallucination_score'] > 1.0:
+        logger.warning(f"High hallucination score for {job['title']}: {audit_result['hallucination_score']:.1f}%")
+        
+        # Attempt correction (simplified - just regenerate once)
+        if audit_result['hallucination_score'] > 3.0:
+            logger.info("Attempting to regenerate resume with stricter guidelines...")
+            resume_content = SkillSyncAutomator.create_fallback_resume(job, master_resume, analysis)
+            profile = analyze_text(resume_content)
+            audit_result = SkillSyncAutomator.audit_resume(profile, master_resume, job)
     
-    logger.info("=" * 60)
-    logger.info("SkillSync Automator Completed")
-    logger.info("=" * 60)
+    return resume_content, profile.words, audit_result
+
+def main():
+    """Main entry point."""
+    listener = configure_logging()
+    try:
+        logger.info("=" * 60)
+        logger.info("SkillSync Automator Starting")
+        logger.info("=" * 60)
+        
+        automator = SkillSyncAutomator()
+        automator.run_automation()
+        
+        logger.info("=" * 60)
+        logger.info("SkillSync Automator Completed")
+        logger.info("=" * 60)
+    finally:
+        shutdown_logging(listener)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file